@@ -1,20 +1,39 @@
 # @track_context("api_setup.md")
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from src.api.dependencies import reset_auth_service
 from src.api.router import api_router
 from src.core.config import settings
+from src.core.redis_client import close_redis_client
+from src.core.supabase_client import close_http_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release pooled connections on shutdown"""
+    yield
+    # The service holds the clients closed below, so drop it along with them
+    reset_auth_service()
+    await close_http_client()
+    await close_redis_client()
+
+
 app = FastAPI(
     title="Supabase Auth API",
     description="Production-ready authentication API with Supabase",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -1,13 +1,16 @@
 # @track_context("auth_endpoints.md")
 
 import logging
+import time
 from typing import Any
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
 
-from src.api.dependencies import get_auth_service, get_current_user, security
-from src.core.constants import Supabase
+from src.api.dependencies import get_auth_service, get_token_claims, security
+from src.core.constants import Cache
 from src.core.messages import ErrorMessages, SuccessMessages
 from src.models.auth import (
     AuthResponse,
@@ -15,16 +18,27 @@ from src.models.auth import (
     OAuthLoginRequest,
     OAuthResponse,
     PasswordResetRequest,
-    TokenResponse,
     UserCreate,
     UserLogin,
-    UserResponse,
 )
-from src.services.auth_service import AuthService
+from src.services.auth_service import AuthService, token_cache_key
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Recent session-check results and token expiry, keyed by token digest
+_session_check_cache: TTLCache[bytes, tuple[dict[str, Any], float]] = TTLCache(
+    maxsize=Cache.SESSION_CHECK_MAX_SIZE, ttl=Cache.SESSION_CHECK_TTL_SECONDS
+)
+
+
+def evict_user_session_checks(user_id: str) -> None:
+    """Drop every cached session-check result for a user"""
+    for cache_key in list(_session_check_cache):
+        cached = _session_check_cache.get(cache_key)
+        if cached is not None and cached[0]["user_id"] == user_id:
+            _session_check_cache.pop(cache_key, None)
+
 
 def handle_auth_error(e: Exception) -> HTTPException:
     """
@@ -48,83 +62,64 @@ def handle_auth_error(e: Exception) -> HTTPException:
     )
 
 
-def format_auth_response(result: dict[str, Any]) -> AuthResponse:
+def format_auth_response(result: dict[str, Any]) -> dict[str, Any]:
     """
     Format Supabase auth result into standardized response
 
     Args:
-        result: Raw result from Supabase auth operation
+        result: Auth dict built by AuthService
 
     Returns:
-        Formatted auth response with user and token data
+        Auth response payload with user and token data, matching AuthResponse
     """
-    # Use pre-extracted full_name if available, otherwise extract safely
-    full_name = result["user"].get("full_name", "")
-    if not full_name:
-        # Fallback: safely handle user_metadata which might be string or dict for OAuth users
-        user_metadata = result["user"]["user_metadata"]
-        if isinstance(user_metadata, dict):
-            full_name = user_metadata.get(Supabase.FULL_NAME_FIELD, "")
-
-    user_response = UserResponse(
-        id=result["user"]["id"],
-        email=result["user"]["email"],
-        full_name=full_name,
-        created_at=result["user"]["created_at"],
-    )
-
-    # Handle optional session data
-    token_response = TokenResponse(
-        access_token="",
-        refresh_token="",
-        token_type="bearer",
-    )
-
-    # Safely handle session data which might be dict or other type
-    session_data = result.get("session")
-    if (
-        session_data
-        and isinstance(session_data, dict)
-        and session_data.get("access_token")
-    ):
-        token_response = TokenResponse(
-            access_token=session_data["access_token"],
-            refresh_token=session_data["refresh_token"],
-            token_type="bearer",
-        )
+    session = result["session"]
 
-    return AuthResponse(user=user_response, token=token_response)
+    # The user dict is already built in response shape by AuthService
+    return {
+        "user": result["user"],
+        "token": {
+            "access_token": session.get("access_token", ""),
+            "refresh_token": session.get("refresh_token", ""),
+            "token_type": "bearer",
+        },
+    }
 
 
 @router.post(
-    "/signup", response_model=AuthResponse, status_code=status.HTTP_201_CREATED
+    "/signup",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": AuthResponse}},
 )
 async def signup(
     user_data: UserCreate,
     auth_service: AuthService = Depends(get_auth_service),
-) -> AuthResponse:
+) -> ORJSONResponse:
     """Register a new user account"""
     try:
         result = await auth_service.signup(user_data)
-        return format_auth_response(result)
+        return ORJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=format_auth_response(result),
+        )
     except Exception as e:
         raise handle_auth_error(e) from e
 
 
-@router.post("/login", response_model=AuthResponse)
+@router.post("/login", responses={status.HTTP_200_OK: {"model": AuthResponse}})
 async def login(
     user_data: UserLogin,
     auth_service: AuthService = Depends(get_auth_service),
-) -> AuthResponse:
+) -> ORJSONResponse:
     """Log in with email and password"""
     try:
         result = await auth_service.login(user_data)
-        return format_auth_response(result)
+        return ORJSONResponse(content=format_auth_response(result))
     except ValueError:
-        raise HTTPException(
+        # Failed logins are routine, so answer directly instead of raising
+        return ORJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=ErrorMessages.INVALID_CREDENTIALS,
-        ) from None
+            content={"detail": ErrorMessages.INVALID_CREDENTIALS},
+        )
     except Exception as e:
         raise handle_auth_error(e) from e
 
@@ -132,9 +127,10 @@ async def login(
 @router.post("/logout", status_code=status.HTTP_200_OK)
 async def logout(
     token: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict[str, Any] = Depends(get_token_claims),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> dict[str, str]:
-    """Log out the current user"""
+    """Log out the current user and revoke their session"""
     try:
         if not token.credentials:
             raise HTTPException(
@@ -142,18 +138,37 @@ async def logout(
                 detail=ErrorMessages.INVALID_TOKEN,
             )
 
-        success = await auth_service.logout(token.credentials)
+        success = await auth_service.logout(token.credentials, claims)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=ErrorMessages.LOGOUT_FAILED,
             )
 
+        # Evict only once revoked, so an in-flight check cannot re-cache it
+        _session_check_cache.pop(token_cache_key(token.credentials), None)
         return {"message": SuccessMessages.LOGOUT_SUCCESS}
     except Exception as e:
         raise handle_auth_error(e) from e
 
 
+@router.post("/logout-all", status_code=status.HTTP_200_OK)
+async def logout_all(
+    token: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict[str, Any] = Depends(get_token_claims),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> dict[str, str]:
+    """Log the current user out of all sessions on every device"""
+    if not await auth_service.logout_all(token.credentials, claims):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorMessages.LOGOUT_FAILED,
+        )
+
+    evict_user_session_checks(str(claims["sub"]))
+    return {"message": SuccessMessages.LOGOUT_ALL_SUCCESS}
+
+
 @router.post("/reset-password", status_code=status.HTTP_200_OK)
 async def reset_password(
     request: PasswordResetRequest,
@@ -169,10 +184,20 @@ async def reset_password(
 
 @router.get("/session-check", status_code=status.HTTP_200_OK)
 async def session_check(
-    current_user: str = Depends(get_current_user),
+    token: HTTPAuthorizationCredentials = Depends(security),
+    auth_service: AuthService = Depends(get_auth_service),
 ) -> dict[str, Any]:
     """Check if the current session is valid"""
-    return {"valid": True, "user_id": current_user}
+    # Polling clients repeat the same token, so serve recent results directly
+    cache_key = token_cache_key(token.credentials)
+    cached = _session_check_cache.get(cache_key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
+    claims = await get_token_claims(token, auth_service)
+    result = {"valid": True, "user_id": str(claims["sub"])}
+    _session_check_cache[cache_key] = (result, claims["exp"])
+    return result
 
 
 @router.post("/oauth/login", response_model=OAuthResponse)
@@ -193,17 +218,17 @@ async def oauth_login(
         raise handle_auth_error(e) from e
 
 
-@router.post("/oauth/callback", response_model=AuthResponse)
+@router.post("/oauth/callback", responses={status.HTTP_200_OK: {"model": AuthResponse}})
 async def oauth_callback(
     request: OAuthCallbackRequest,
     auth_service: AuthService = Depends(get_auth_service),
-) -> AuthResponse:
+) -> ORJSONResponse:
     """Handle Google OAuth callback and exchange code for tokens"""
     try:
         result = await auth_service.handle_oauth_callback(
             request.provider, request.code, request.redirect_url
         )
-        return format_auth_response(result)
+        return ORJSONResponse(content=format_auth_response(result))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import lru_cache
 
 from pydantic_settings import BaseSettings
 
@@ -30,6 +31,9 @@ class Settings(BaseSettings):
     SUPABASE_KEY: str = ""
     SUPABASE_JWT_SECRET: str = ""
 
+    # Redis - optional, enables session revocation on logout
+    REDIS_URL: str = ""
+
     # Application settings
     DEBUG: bool = Defaults.DEBUG
     TESTING: bool = Defaults.TESTING
@@ -39,6 +43,7 @@ class Settings(BaseSettings):
     model_config = {"env_file": ".env", "case_sensitive": True}
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings with optional Google Secret Manager integration"""
     # Load secrets from GSM if enabled (automatically falls back to env variables)
@@ -52,7 +57,7 @@ def should_use_testing() -> bool:
     return os.environ.get(EnvVars.TESTING, "").lower() in ("true", "1", "t")
 
 
-# Load settings using the function
+# Load settings once; modules import this shared instance
 settings = get_settings()
 
 # Set log level
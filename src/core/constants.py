@@ -21,6 +21,7 @@ class EnvVars:
     TESTING = "TESTING"
     LOG_LEVEL = "LOG_LEVEL"
     USE_GSM = "USE_GSM"
+    REDIS_URL = "REDIS_URL"
 
     # Google Cloud
     GCP_PROJECT_ID = "GCP_PROJECT_ID"
@@ -55,6 +56,10 @@ class Validation:
     # Password requirements
     MIN_PASSWORD_LENGTH = 8
 
+    # Email syntax check; Supabase Auth performs full address validation
+    EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+    MAX_EMAIL_LENGTH = 254
+
 
 class Supabase:
     """Supabase-specific constants"""
@@ -65,10 +70,57 @@ class Supabase:
     # User metadata fields
     FULL_NAME_FIELD = "full_name"
 
+    # JWT claim identifying the auth session a token belongs to
+    SESSION_ID_CLAIM = "session_id"
+
+    # Auth (GoTrue) REST endpoints, relative to SUPABASE_URL
+    AUTH_SIGNUP_PATH = "/auth/v1/signup"
+    AUTH_TOKEN_PATH = "/auth/v1/token"
+    AUTH_LOGOUT_PATH = "/auth/v1/logout"
+    AUTH_RECOVER_PATH = "/auth/v1/recover"
+
     # GSM secret path template
     SECRET_PATH_TEMPLATE = "projects/{project_id}/secrets/{secret_name}/versions/latest"
 
 
+class HTTPPool:
+    """Shared HTTP client pool settings"""
+
+    MAX_CONNECTIONS = 120
+    MAX_KEEPALIVE_CONNECTIONS = 80
+    KEEPALIVE_EXPIRY_SECONDS = 30.0
+    TIMEOUT_SECONDS = 10.0
+
+
+class Cache:
+    """In-process cache limits"""
+
+    # Decoded JWT claims, keyed by token digest
+    JWT_CLAIMS_MAX_SIZE = 50_000
+    JWT_CLAIMS_TTL_SECONDS = 60
+
+    # /session-check results; bounds how long another worker may miss a logout
+    SESSION_CHECK_MAX_SIZE = 10_000
+    SESSION_CHECK_TTL_SECONDS = 10
+
+
+class RedisKeys:
+    """Redis key templates
+
+    Per-user keys share the {user_id} hash tag so a single MGET can read
+    them together, including on Redis Cluster.
+    """
+
+    # Sessions revoked at logout, kept until their tokens have expired
+    REVOKED_SESSION = "auth:{{{user_id}}}:revoked:{session_id}"
+
+    # Present while a user is disabled (e.g. soft-deleted); set outside this API
+    USER_DISABLED = "auth:{{{user_id}}}:disabled"
+
+    # Unix time before which all of a user's tokens are rejected (logout-all)
+    USER_NOT_BEFORE = "auth:{{{user_id}}}:not_before"
+
+
 class OAuth:
     """OAuth provider constants"""
 
@@ -13,7 +13,7 @@ class ErrorMessages:
 
     INVALID_CREDENTIALS = "Invalid email or password"
     INVALID_TOKEN = "Invalid authentication token"
-    INVALID_TOKEN_MISSING_USER = "Invalid token: missing user identifier"
+    TOKEN_REVOKED = "Token has been revoked"
 
     LOGOUT_FAILED = "Failed to log out"
     REGISTRATION_FAILED = "Registration failed"
@@ -24,6 +24,7 @@ class SuccessMessages:
     """Success messages shown to users"""
 
     LOGOUT_SUCCESS = "Successfully logged out"
+    LOGOUT_ALL_SUCCESS = "Successfully logged out of all sessions"
     PASSWORD_RESET_SENT = "Password reset email sent"
 
 
@@ -33,6 +34,7 @@ class LogMessages:
     USER_CREATED = "User created: {user_id}"
     USER_LOGGED_IN = "User logged in: {user_id}"
     USER_LOGGED_OUT = "User logged out successfully"
+    USER_LOGGED_OUT_ALL = "User logged out of all sessions: {user_id}"
 
     # Settings loading
     LOADING_FROM_ENV = "Loading settings from environment variables (GSM disabled)"
@@ -48,5 +50,5 @@ class LogMessages:
     SECRET_ACCESS_ERROR = "Error accessing secret {secret_name}: {error}"
 
     # JWT validation
-    JWT_MISSING_SUB = "Token is valid but missing 'sub' claim"
     JWT_VALIDATION_FAILED = "JWT validation failed: {error}"
+    JWT_REVOKED = "Rejected revoked token for user: {user_id}"
@@ -0,0 +1,24 @@
+# @track_context("config.md")
+
+from redis.asyncio import Redis
+
+from src.core.config import settings
+
+# Global client instance; redis-py pools connections internally
+_redis_client: Redis | None = None
+
+
+def get_redis_client() -> Redis | None:
+    """Get Redis client instance (singleton), or None if REDIS_URL is not set"""
+    global _redis_client
+    if _redis_client is None and settings.REDIS_URL:
+        _redis_client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """Close the Redis client, if it was created"""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
@@ -65,5 +65,6 @@ def load_secrets_from_gsm() -> None:
                 )
 
 
+@lru_cache(maxsize=1)
 def should_use_gsm() -> bool:
     return os.environ.get(EnvVars.USE_GSM, "false").lower() in ("true", "1", "t")
@@ -0,0 +1,36 @@
+# @track_context("singleflight.md")
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """Collapse concurrent calls with the same key into a single execution"""
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Future[T]] = {}
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn for key, or join the call already in flight for it
+
+        Args:
+            key: Identifies calls that are interchangeable
+            fn: Zero-argument coroutine factory performing the work
+
+        Returns:
+            The result shared by every caller of the same flight
+        """
+        # No await between lookup and insert, so this is atomic on the loop
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller's cancellation does not fail the others
+        return await asyncio.shield(flight)
@@ -1,16 +1,51 @@
 # @track_context("config.md")
 
+import httpx
 from supabase import Client, create_client
 
 from src.core.config import settings
+from src.core.constants import HTTPPool
 
 # Global client instance to preserve PKCE state
 _supabase_client: Client | None = None
 
+# Global async HTTP client so Auth REST calls reuse pooled connections
+_http_client: httpx.AsyncClient | None = None
+
 
 def get_supabase_client() -> Client:
     """Get Supabase client instance (singleton to preserve PKCE state)"""
     global _supabase_client
     if _supabase_client is None:
+        # Only called from the event loop thread, so no lock is needed
         _supabase_client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
     return _supabase_client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get pooled async HTTP client for the Supabase REST APIs (singleton)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=settings.SUPABASE_URL,
+            headers={
+                "apikey": settings.SUPABASE_KEY,
+                "Authorization": f"Bearer {settings.SUPABASE_KEY}",
+            },
+            limits=httpx.Limits(
+                max_connections=HTTPPool.MAX_CONNECTIONS,
+                max_keepalive_connections=HTTPPool.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTPPool.KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=HTTPPool.TIMEOUT_SECONDS,
+            http2=True,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled HTTP client, if it was created"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -2,16 +2,28 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field, StringConstraints
 
 from src.core.constants import OAuth, Validation
 
+# Normalized email address, checked with a regex compiled once by pydantic-core
+Email = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        max_length=Validation.MAX_EMAIL_LENGTH,
+        pattern=Validation.EMAIL_PATTERN,
+    ),
+]
+
 
 class UserBase(BaseModel):
     """Base user schema"""
 
-    email: EmailStr
+    email: Email
 
 
 class UserCreate(UserBase):
@@ -27,9 +39,11 @@ class UserLogin(UserBase):
     password: str
 
 
-class UserResponse(UserBase):
+class UserResponse(BaseModel):
     """User response schema"""
 
+    # Server-built output, so skip re-running email validation
+    email: str
     id: str
     full_name: str
     created_at: datetime | None = None
@@ -53,7 +67,7 @@ class AuthResponse(BaseModel):
 class PasswordResetRequest(BaseModel):
     """Password reset request schema"""
 
-    email: EmailStr
+    email: Email
 
 
 class OAuthProvider(str, Enum):
@@ -0,0 +1,63 @@
+# @track_context("auth_cache.md")
+
+import time
+from typing import Any
+
+from redis.asyncio import Redis
+
+from src.core.constants import RedisKeys, Supabase
+
+
+class AuthCacheClient:
+    """Redis-backed revocation state checked on authenticated requests"""
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+
+    async def is_token_revoked(self, claims: dict[str, Any]) -> bool:
+        """Check session revocation and user status in a single round trip"""
+        user_id = claims["sub"]
+        revoked, disabled, not_before = await self.redis.mget(
+            RedisKeys.REVOKED_SESSION.format(
+                user_id=user_id,
+                session_id=claims.get(Supabase.SESSION_ID_CLAIM) or "",
+            ),
+            RedisKeys.USER_DISABLED.format(user_id=user_id),
+            RedisKeys.USER_NOT_BEFORE.format(user_id=user_id),
+        )
+        if revoked is not None or disabled is not None:
+            return True
+
+        # Tokens issued before the user's last logout-all are rejected
+        if not_before is None:
+            return False
+        return int(claims.get("iat") or 0) < int(not_before)
+
+    async def revoke_session(self, claims: dict[str, Any]) -> None:
+        """Deny-list the token's session so its access tokens stop validating"""
+        session_id = claims.get(Supabase.SESSION_ID_CLAIM)
+        if not session_id:
+            return
+
+        # Every token issued for this session expires within one token lifetime
+        ttl = int(claims["exp"]) - int(claims.get("iat") or time.time())
+        if ttl > 0:
+            await self.redis.set(
+                RedisKeys.REVOKED_SESSION.format(
+                    user_id=claims["sub"], session_id=session_id
+                ),
+                1,
+                ex=ttl,
+            )
+
+    async def revoke_all_sessions(self, claims: dict[str, Any]) -> None:
+        """Reject every token issued to the user up to and including now"""
+        now = int(time.time())
+        ttl = int(claims["exp"]) - int(claims.get("iat") or now)
+        # 'iat' has one-second granularity, so the cutoff covers the current
+        # second; a fresh login within that same second is rejected as well
+        await self.redis.set(
+            RedisKeys.USER_NOT_BEFORE.format(user_id=claims["sub"]),
+            now + 1,
+            ex=max(ttl, 1) + 1,
+        )
@@ -1,45 +1,157 @@
 # @track_context("auth_service.md")
 
+import asyncio
+import hashlib
 import logging
+import time
 from typing import Any
 
-from src.core.constants import OAuth, Supabase
+import jwt
+import orjson
+from cachetools import TTLCache
+
+from src.core.config import settings
+from src.core.constants import Cache, OAuth, Supabase
 from src.core.messages import ErrorMessages, LogMessages
-from src.core.supabase_client import get_supabase_client
+from src.core.redis_client import get_redis_client
+from src.core.singleflight import SingleFlight
+from src.core.supabase_client import get_http_client, get_supabase_client
 from src.models.auth import UserCreate, UserLogin
+from src.services.auth_cache import AuthCacheClient
+from src.services.gotrue_client import GoTrueClient
 
 logger = logging.getLogger(__name__)
 
+# Verification inputs are fixed for the process, so build them once
+_JWT_SECRET = settings.SUPABASE_JWT_SECRET.encode("utf-8")
+_JWT_DECODE_KW: dict[str, Any] = {
+    "algorithms": ["HS256"],
+    "audience": "authenticated",
+    "options": {
+        "verify_signature": True,
+        "verify_exp": True,
+        "verify_aud": True,
+        "require": ["exp", "sub", "aud"],
+    },
+}
+_FULL_NAME = Supabase.FULL_NAME_FIELD
+
+
+class _ORJSONJWT(jwt.PyJWT):
+    """PyJWT decoder that parses token payloads with orjson"""
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt_decoder = _ORJSONJWT()
+
+# Decoded claims by token digest; only touched from the event loop thread
+_claims_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    maxsize=Cache.JWT_CLAIMS_MAX_SIZE, ttl=Cache.JWT_CLAIMS_TTL_SECONDS
+)
+
+
+def token_cache_key(token: str) -> bytes:
+    """Return a compact digest of a token for use as an in-process cache key"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def validate_jwt_token(token: str) -> dict[str, Any]:
+    """
+    Validate JWT token and return its claims
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Decoded token claims, guaranteed to contain a 'sub' user_id
+
+    Raises:
+        ValueError: If token is invalid
+    """
+    # Repeat tokens skip signature and claim verification until they expire
+    cache_key = token_cache_key(token)
+    cached: dict[str, Any] | None = _claims_cache.get(cache_key)
+    if cached is not None and cached["exp"] > time.time():
+        return cached
+
+    try:
+        # Decode and verify token; a missing 'sub' fails the required claims
+        payload: dict[str, Any] = _jwt_decoder.decode(
+            token, _JWT_SECRET, **_JWT_DECODE_KW
+        )
+    except jwt.InvalidTokenError as err:
+        logger.warning(LogMessages.JWT_VALIDATION_FAILED.format(error=err))
+        raise ValueError(ErrorMessages.INVALID_TOKEN) from err
+
+    # 'require' only rejects absent claims, so an empty 'sub' is checked here
+    if not payload["sub"]:
+        raise ValueError(ErrorMessages.INVALID_TOKEN)
+
+    _claims_cache[cache_key] = payload
+    return payload
+
 
 class AuthService:
-    """Service for authentication operations"""
+    """Service for authentication operations
+
+    Email/password and token flows call the Auth REST API through the
+    pooled async GoTrueClient. Only the OAuth flow stays on the synchronous
+    Supabase client, which stores the PKCE verifier; its code exchange runs
+    via asyncio.to_thread to keep the event loop free for other requests.
+    """
 
     def __init__(self) -> None:
         self.client = get_supabase_client()
+        self.gotrue = GoTrueClient(get_http_client())
+        redis = get_redis_client()
+        self.auth_cache = AuthCacheClient(redis) if redis is not None else None
+        # Concurrent revocation checks for the same token share one lookup
+        self._revocation_checks: SingleFlight[tuple[Any, ...], bool] = SingleFlight()
+
+    async def authenticate(self, token: str) -> dict[str, Any]:
+        """Validate an access token and return its claims if not revoked"""
+        claims = validate_jwt_token(token)
+
+        # Local JWT checks pass until expiry, so consult the revocation state
+        auth_cache = self.auth_cache
+        if auth_cache is not None and await self._revocation_checks.do(
+            (claims["sub"], claims.get(Supabase.SESSION_ID_CLAIM), claims.get("iat")),
+            lambda: auth_cache.is_token_revoked(claims),
+        ):
+            logger.warning(LogMessages.JWT_REVOKED.format(user_id=claims["sub"]))
+            raise ValueError(ErrorMessages.TOKEN_REVOKED)
+
+        return claims
 
     async def signup(self, user_data: UserCreate) -> dict[str, Any]:
         """Register a new user in Supabase Auth"""
         try:
-            auth_response = self.client.auth.sign_up(
-                {
-                    "email": user_data.email,
-                    "password": user_data.password,
-                    "options": {
-                        "data": {
-                            Supabase.FULL_NAME_FIELD: user_data.full_name,
-                        }
-                    },
-                }
+            body = await self.gotrue.sign_up(
+                user_data.email,
+                user_data.password,
+                {_FULL_NAME: user_data.full_name},
             )
 
-            if not hasattr(auth_response, "user") or not auth_response.user:
+            # Without email confirmation the body is a session, else the user
+            session = body if "access_token" in body else None
+            user = body.get("user") if session else body
+
+            if not user or not user.get("id"):
                 raise ValueError(
                     f"{ErrorMessages.REGISTRATION_FAILED}: Could not create user"
                 )
 
-            logger.info(LogMessages.USER_CREATED.format(user_id=auth_response.user.id))
+            logger.info(LogMessages.USER_CREATED.format(user_id=user["id"]))
 
-            return self._build_auth_dict(auth_response)
+            return self._build_auth_dict(user, session)
 
         except Exception as e:
             logger.error(f"Signup error: {e!s}")
@@ -48,43 +160,50 @@ class AuthService:
     async def login(self, user_data: UserLogin) -> dict[str, Any]:
         """Authenticate a user with email and password"""
         try:
-            auth_response = self.client.auth.sign_in_with_password(
-                {
-                    "email": user_data.email,
-                    "password": user_data.password,
-                }
+            session = await self.gotrue.sign_in_with_password(
+                user_data.email, user_data.password
             )
 
-            if (
-                not hasattr(auth_response, "user")
-                or not auth_response.user
-                or not auth_response.session
-            ):
+            user = session.get("user")
+            if not user or not session.get("access_token"):
                 raise ValueError(
                     f"{ErrorMessages.AUTHENTICATION_FAILED}: Invalid credentials"
                 )
 
-            logger.info(
-                LogMessages.USER_LOGGED_IN.format(user_id=auth_response.user.id)
-            )
-            return self._build_auth_dict(auth_response)
+            logger.info(LogMessages.USER_LOGGED_IN.format(user_id=user["id"]))
+            return self._build_auth_dict(user, session)
 
         except Exception as e:
             logger.error(f"Login error: {e!s}")
             raise ValueError(f"{ErrorMessages.AUTHENTICATION_FAILED}: {e!s}") from e
 
-    async def logout(self, token: str) -> bool:
+    async def logout(self, token: str, claims: dict[str, Any]) -> bool:
         try:
-            self.client.auth.sign_out()
+            if self.auth_cache is not None:
+                await self.auth_cache.revoke_session(claims)
+            await self.gotrue.sign_out(token)
             logger.info(LogMessages.USER_LOGGED_OUT)
             return True
         except Exception as e:
             logger.error(f"Logout error: {e!s}")
             return False
 
+    async def logout_all(self, token: str, claims: dict[str, Any]) -> bool:
+        """Sign the user out of every session, on all devices"""
+        try:
+            # Revoke refresh tokens first so no token can be issued after the cutoff
+            await self.gotrue.sign_out(token, scope="global")
+            if self.auth_cache is not None:
+                await self.auth_cache.revoke_all_sessions(claims)
+            logger.info(LogMessages.USER_LOGGED_OUT_ALL.format(user_id=claims["sub"]))
+            return True
+        except Exception as e:
+            logger.error(f"Logout-all error: {e!s}")
+            return False
+
     async def request_password_reset(self, email: str) -> bool:
         try:
-            self.client.auth.reset_password_for_email(email)
+            await self.gotrue.recover(email)
             return True
         except Exception as e:
             logger.error(f"Password reset error: {e!s}")
@@ -113,8 +232,8 @@ class AuthService:
             # Pass proper CodeExchangeParams format - Supabase will get code_verifier from storage
             code_exchange_params = {"auth_code": code, "redirect_to": redirect_url}
 
-            auth_response = self.client.auth.exchange_code_for_session(
-                code_exchange_params
+            auth_response = await asyncio.to_thread(
+                self.client.auth.exchange_code_for_session, code_exchange_params
             )
 
             if not auth_response.user or not auth_response.session:
@@ -123,46 +242,38 @@ class AuthService:
             logger.info(
                 LogMessages.USER_LOGGED_IN.format(user_id=auth_response.user.id)
             )
-            return self._build_auth_dict(auth_response)
+            return self._build_auth_dict(
+                auth_response.user.model_dump(), auth_response.session.model_dump()
+            )
 
         except Exception as e:
             logger.error(f"OAuth callback error: {e!s}")
             raise ValueError(f"OAuth authentication failed: {e!s}") from e
 
-    def _build_auth_dict(self, auth_response: Any) -> dict[str, Any]:
+    def _build_auth_dict(
+        self, user: dict[str, Any], session: dict[str, Any] | None
+    ) -> dict[str, Any]:
         """Build auth dict in format expected by format_auth_response helper"""
-        user_metadata = auth_response.user.user_metadata
-        if isinstance(user_metadata, str):
-            logger.warning(f"User metadata is string instead of dict: {user_metadata}")
-            user_metadata = {}
-        elif user_metadata is None:
+        # OAuth users may come back with metadata as a string or missing
+        user_metadata = user.get("user_metadata")
+        if not isinstance(user_metadata, dict):
+            if user_metadata:
+                logger.warning(f"User metadata is not a dict: {user_metadata}")
             user_metadata = {}
 
-        full_name = ""
-        if isinstance(user_metadata, dict):
-            full_name = user_metadata.get(Supabase.FULL_NAME_FIELD, "")
-
-        user_dict = {
-            "id": auth_response.user.id,
-            "email": auth_response.user.email,
-            "user_metadata": user_metadata,
-            "full_name": full_name,
-            "created_at": auth_response.user.created_at,
-        }
-
         session_dict = {}
-        if auth_response.session:
-            session_obj = auth_response.session
-            access_token = getattr(session_obj, "access_token", None)
-            refresh_token = getattr(session_obj, "refresh_token", None)
-
-            if access_token:
-                session_dict = {
-                    "access_token": access_token,
-                    "refresh_token": refresh_token or "",
-                }
+        if session and session.get("access_token"):
+            session_dict = {
+                "access_token": session["access_token"],
+                "refresh_token": session.get("refresh_token") or "",
+            }
 
         return {
-            "user": user_dict,
+            "user": {
+                "id": user["id"],
+                "email": user.get("email"),
+                "full_name": user_metadata.get(_FULL_NAME, ""),
+                "created_at": user.get("created_at"),
+            },
             "session": session_dict,
         }
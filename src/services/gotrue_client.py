@@ -0,0 +1,88 @@
+# @track_context("gotrue_client.md")
+
+import logging
+from typing import Any
+
+import httpx
+import orjson
+
+from src.core.constants import Supabase
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class GoTrueClient:
+    """Async client for the Supabase Auth (GoTrue) REST API"""
+
+    def __init__(self, http: httpx.AsyncClient) -> None:
+        self.http = http
+
+    async def sign_up(
+        self, email: str, password: str, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Create a user; returns a session, or just the user if unconfirmed"""
+        return await self._post(
+            Supabase.AUTH_SIGNUP_PATH,
+            {"email": email, "password": password, "data": data},
+        )
+
+    async def sign_in_with_password(self, email: str, password: str) -> dict[str, Any]:
+        """Exchange email and password for a session"""
+        return await self._post(
+            Supabase.AUTH_TOKEN_PATH,
+            {"email": email, "password": password},
+            params={"grant_type": "password"},
+        )
+
+    async def sign_out(self, access_token: str, scope: str = "local") -> None:
+        """Revoke the refresh tokens of the session behind access_token"""
+        await self._post(
+            Supabase.AUTH_LOGOUT_PATH,
+            params={"scope": scope},
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+    async def recover(self, email: str) -> None:
+        """Send a password recovery email"""
+        await self._post(Supabase.AUTH_RECOVER_PATH, {"email": email})
+
+    async def _post(
+        self,
+        path: str,
+        body: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """POST a JSON body (encoded with orjson) and parse the response"""
+        if body is not None:
+            headers = {**_JSON_HEADERS, **(headers or {})}
+        response = await self.http.post(
+            path,
+            content=orjson.dumps(body) if body is not None else None,
+            params=params,
+            headers=headers,
+        )
+        return self._parse(response)
+
+    def _parse(self, response: httpx.Response) -> dict[str, Any]:
+        """Return the JSON body, raising ValueError with GoTrue's message on error"""
+        try:
+            body: Any = orjson.loads(response.content) if response.content else {}
+        except orjson.JSONDecodeError:
+            body = {}
+
+        if response.is_success:
+            return body if isinstance(body, dict) else {}
+
+        message = response.text
+        if isinstance(body, dict):
+            message = (
+                body.get("msg")
+                or body.get("error_description")
+                or body.get("message")
+                or message
+            )
+        logger.debug(f"GoTrue error {response.status_code}: {message}")
+        raise ValueError(message)